@@ -1,12 +1,65 @@
 import os
+import sys
+import numpy as np
 import pandas as pd
 import time
 import schedule
-from datetime import datetime, timedelta
+from datetime import datetime
 import logging
-from hyperliquid.info import Info
+import logging.handlers
+import shutil
 import traceback
+import threading
+from contextlib import contextmanager
+import json
+import importlib.util
+import csv
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+
+# Optional fast JSON codec; the stdlib json module is used when it's missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional dependency for Parquet storage (also used for faster CSV reads)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pacsv = None
+    ds = None
+    pq = None
+
+# Optional dependency for HTTP/2 (pip install "httpx[http2]")
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Settings read from the environment that had to fall back to their default; logged
+# once logging is configured
+CONFIG_WARNINGS = []
+
+def env_int(name, default, minimum=1):
+    """Read an integer setting from the environment, using the default for a bad value"""
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = None
+    if value is None or value < minimum:
+        CONFIG_WARNINGS.append(f"{name}={raw!r} is not an integer >= {minimum} - using {default}")
+        return default
+    return value
 
 # Configuration
 # GitHub Actions compatibility
@@ -22,6 +75,46 @@ if not os.path.exists(DOWNLOADS_FOLDER):
 BASE_URL = "https://api.hyperliquid.xyz"
 INTERVAL = "30m"  # 30-minute intervals
 HISTORICAL_DAYS = 365  # Changed from 30 to 365 days
+DAY_MS = 86400 * 1000  # One day in epoch milliseconds
+INTERVAL_MS = 30 * 60 * 1000  # Length of one candle in epoch milliseconds
+# Consecutive 30-minute candles further apart than this count as a gap (allow some tolerance)
+MAX_GAP_NS = int(INTERVAL_MS * 1.5 * 10**6)
+# Concurrency and request rate can be tuned per environment (e.g. a shared CI runner IP)
+MAX_WORKERS = env_int('MAX_WORKERS', 16)  # Assets processed concurrently
+CHUNK_WORKERS = env_int('CHUNK_WORKERS', 8)  # History chunks of one asset fetched concurrently
+# Hyperliquid limits REST traffic by weight per IP: an info request costs 20, and
+# candleSnapshot adds 1 for every 60 candles returned
+RATE_LIMIT_WEIGHT = env_int('RATE_LIMIT_WEIGHT', 1200)  # Weight per minute shared by all workers
+INFO_REQUEST_WEIGHT = 20
+CANDLES_PER_WEIGHT = 60
+RATE_LIMIT_BURST = 4 * INFO_REQUEST_WEIGHT  # Weight that may go out at once, taken from the minute's budget
+REQUEST_TIMEOUT = 30  # Seconds per HTTP request
+RATE_LIMIT_RETRIES = 3  # Attempts per request after the exchange answers 429
+MAX_BACKOFF = 60  # Longest global pause (seconds) after repeated rate-limit pushback
+USE_HTTP2 = os.getenv('USE_HTTP2', '').lower() == 'true'  # Multiplex requests on one connection
+META_CACHE_TTL = 6 * 3600  # Seconds the exchange symbol list is reused before refetching
+
+# Storage format: 'csv' (one file per asset) or 'parquet' (one dataset partitioned by asset)
+STORAGE_FORMAT = os.getenv('STORAGE_FORMAT', 'csv').lower()
+PARQUET_DATASET = 'ohlc_30.parquet'
+PARQUET_COMPRESSION = 'zstd'  # Column compression for Parquet part files
+PARQUET_COMPACT_PARTS = 48  # Fold an asset's appended parts into one file at this many (~1 day of updates)
+CURSOR_FILE = 'ohlc_cursors.json'  # storage format -> asset -> latest saved timestamp (ms)
+SYMBOLS_CACHE_FILE = '.symbols_cache.json'  # Last fetched exchange symbol list, reused across runs
+CSV_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+CSV_LINE_TERMINATOR = os.linesep  # What to_csv has always written; appends must match rewrites
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+LOG_MAX_BYTES = 5 * 1024 * 1024  # Rotate the log file at this size
+LOG_BACKUP_COUNT = 3  # Rotated log files kept
+
+# Fixed-width record layout for parsed candles (end time, open, high, low, close, volume).
+# Hyperliquid prices carry at most 5 significant figures, so float32 holds them exactly
+# at half the memory; volumes need the extra digits of float64.
+OHLC_DTYPE = np.dtype([('T', '<i8'), ('o', '<f4'), ('h', '<f4'), ('l', '<f4'), ('c', '<f4'), ('v', '<f8')])
+PRICE_DTYPES = {'open': 'float32', 'high': 'float32', 'low': 'float32', 'close': 'float32'}
+# Columns written to storage. The asset is already in the file (or partition) name, so
+# frames carry no per-row asset label.
+STORED_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
 
 # Full list of assets to track (from your script output)
 ASSETS = [
@@ -50,22 +143,380 @@ def get_hyperliquid_symbol(asset):
     """Get the correct symbol for Hyperliquid API"""
     return HYPERLIQUID_SYMBOL_MAP.get(asset, asset)
 
+# Exchange symbol list shared by every puller in this process (the scheduler builds a new
+# one per cycle), so the meta request is only repeated once the TTL runs out. Seeded from
+# SYMBOLS_CACHE_FILE so separate runs (cron, GitHub Actions) share it too.
+_META_CACHE = {'symbols': None, 'ts': 0.0}
+
+class RateLimiter:
+    """Thread-safe token bucket so the request budget is global across workers.
+    
+    Tokens are request weight units, refilled at rate per second.
+    """
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.paused_until = 0.0  # Set when the exchange pushes back; holds every worker
+        self.backoff_count = 0
+        self.lock = threading.Lock()
+
+    def acquire(self, weight=1):
+        """Block until the bucket holds weight tokens, then take them"""
+        # More than a full bucket could never be available at once
+        weight = min(weight, self.capacity)
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                else:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                    self.last_refill = now
+                    if self.tokens >= weight:
+                        self.tokens -= weight
+                        return
+                    wait = (weight - self.tokens) / self.rate
+            time.sleep(wait)
+    
+    def charge(self, weight):
+        """Take weight only known once the response is in; later requests wait off the debt"""
+        with self.lock:
+            self.tokens -= weight
+
+    def backoff(self, retry_after=None):
+        """Pause all workers after rate-limit pushback, exponentially unless the server says how long"""
+        with self.lock:
+            self.backoff_count += 1
+            delay = retry_after if retry_after is not None else min(MAX_BACKOFF, 2 ** (self.backoff_count - 1))
+            self.paused_until = max(self.paused_until, time.monotonic() + delay)
+            # Start refilling from an empty bucket once the pause ends, so it doesn't end in a burst
+            self.tokens = 0
+            self.last_refill = self.paused_until
+            return delay
+
+    def reset_backoff(self):
+        """Forget earlier pushback once a request goes through"""
+        if self.backoff_count:
+            with self.lock:
+                self.backoff_count = 0
+
+def epoch_ms():
+    """Current UTC epoch time in milliseconds, the unit the candle API uses"""
+    return time.time_ns() // 10**6
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After style header, or None if absent or not a delay"""
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None  # missing, or an HTTP date
+    if seconds >= 10**9:
+        seconds -= time.time()  # some APIs send an absolute epoch time instead of a delay
+    return min(MAX_BACKOFF, max(0.0, seconds))
+
 # Setup logging without emojis to avoid Unicode errors
 log_file = os.path.join(DOWNLOADS_FOLDER, 'hl_ohlc_puller.log')
+# The log file is size-capped for long-running mode, and records reach it in batches
+# rather than one write per line; warnings and errors go out immediately
+log_file_handler = logging.handlers.RotatingFileHandler(
+    log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+)
+log_buffer = logging.handlers.MemoryHandler(
+    capacity=512, flushLevel=logging.WARNING, target=log_file_handler
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(log_file, encoding='utf-8'),
+        log_buffer,
         logging.StreamHandler()
     ]
 )
+log_file_handler.setFormatter(log_buffer.formatter)
+
+for message in CONFIG_WARNINGS:
+    logging.warning(message)
+
+if STORAGE_FORMAT == 'parquet' and pq is None:
+    logging.warning("pyarrow is not installed - falling back to CSV storage")
+    STORAGE_FORMAT = 'csv'
+
+if USE_HTTP2 and httpx is None:
+    logging.warning("httpx is not installed - falling back to HTTP/1.1")
+    USE_HTTP2 = False
+elif USE_HTTP2 and importlib.util.find_spec('h2') is None:
+    # httpx only imports its HTTP/2 support (the h2 package) when a client asks for it
+    logging.warning("h2 is not installed (pip install 'httpx[http2]') - falling back to HTTP/1.1")
+    USE_HTTP2 = False
+
+# The weight budget must cover the burst plus at least one request of refill
+if RATE_LIMIT_WEIGHT < 2 * INFO_REQUEST_WEIGHT:
+    logging.warning(f"RATE_LIMIT_WEIGHT={RATE_LIMIT_WEIGHT} can't fit a request - using {2 * INFO_REQUEST_WEIGHT}")
+    RATE_LIMIT_WEIGHT = 2 * INFO_REQUEST_WEIGHT
+RATE_LIMIT_BURST = min(RATE_LIMIT_BURST, RATE_LIMIT_WEIGHT // 2)
+
+@contextmanager
+def atomic_write(path, mode='wb', **kwargs):
+    """Write to a temp file and swap it into place, so a crash never leaves a truncated file"""
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    fsync_directory(os.path.dirname(path) or '.')
+
+def fsync_directory(path):
+    """Best-effort fsync of a directory so a rename into it survives a power loss"""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return  # e.g. Windows, where directories can't be opened for fsync
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # some filesystems don't support fsync on directories
+    finally:
+        os.close(fd)
+
+def parse_csv_timestamps(values):
+    """Parse stored 'YYYY-MM-DD HH:MM:SS' timestamps into datetime64[ns] values"""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    try:
+        # Every row is a unique fixed-width ISO string, so memoizing in pd.to_datetime
+        # doesn't help; NumPy's native ISO parser is several times faster
+        return np.asarray(values, dtype=object).astype('datetime64[s]').astype('datetime64[ns]')
+    except ValueError:
+        # Something isn't in the stored shape - let pandas validate it row by row
+        return pd.to_datetime(values, format=CSV_TIMESTAMP_FORMAT, cache=True)
+
+def parse_csv_row_timestamp(line):
+    """Parse the timestamp field of one stored CSV row, raising ValueError if it has none"""
+    timestamp = pd.to_datetime(line.split(',')[0], format=CSV_TIMESTAMP_FORMAT)
+    # An empty field parses to NaT instead of raising
+    if pd.isna(timestamp):
+        raise ValueError(f"no timestamp in CSV row {line!r}")
+    return timestamp
+
+def read_csv_data(file_path):
+    """Read a stored CSV file with typed columns and parsed timestamps"""
+    if pacsv is not None:
+        # Arrow's multi-threaded reader converts each column straight into its type,
+        # timestamps included, so nothing is re-parsed in Python afterwards
+        convert_options = pacsv.ConvertOptions(
+            column_types={
+                'timestamp': pa.timestamp('ns'),
+                **{col: pa.float32() for col in PRICE_DTYPES},
+                'volume': pa.float64()
+            },
+            timestamp_parsers=[CSV_TIMESTAMP_FORMAT]
+        )
+        return pacsv.read_csv(file_path, convert_options=convert_options).to_pandas()
+    
+    # Read prices straight into float32 so merges don't upcast new candles
+    df = pd.read_csv(file_path, dtype=PRICE_DTYPES)
+    # Parse timestamp with explicit format to ensure proper date/time handling
+    df['timestamp'] = parse_csv_timestamps(df['timestamp'])
+    return df
+
+def read_csv_timestamps(file_path):
+    """Read only the timestamp column of a stored CSV file as datetime64[ns] values"""
+    if pacsv is not None:
+        convert_options = pacsv.ConvertOptions(
+            include_columns=['timestamp'],
+            column_types={'timestamp': pa.timestamp('ns')},
+            timestamp_parsers=[CSV_TIMESTAMP_FORMAT]
+        )
+        table = pacsv.read_csv(file_path, convert_options=convert_options)
+        return table.column('timestamp').to_numpy().astype('datetime64[ns]')
+    timestamps = pd.read_csv(file_path, usecols=['timestamp'])['timestamp']
+    return np.asarray(parse_csv_timestamps(timestamps), dtype='datetime64[ns]')
+
+def sort_and_dedupe(df):
+    """Sort candles by timestamp, keeping the last copy of any repeated timestamp.
+    
+    A stable sort puts repeats next to each other in their original order, so one
+    comparison of neighbouring int64 timestamps finds them, with no hash table.
+    """
+    if len(df) == 0:
+        return df.reset_index(drop=True)
+    timestamps = df['timestamp'].to_numpy().view('int64')
+    order = np.argsort(timestamps, kind='stable')
+    timestamps = timestamps[order]
+    keep = np.empty(len(timestamps), dtype=bool)
+    keep[-1] = True
+    np.not_equal(timestamps[1:], timestamps[:-1], out=keep[:-1])
+    return df.take(order[keep]).reset_index(drop=True)
+
+def read_parquet_parts(parts, columns=STORED_COLUMNS):
+    """Read an asset's Parquet part files into one sorted, de-duplicated frame"""
+    # Older parts may still carry an hl_symbol column; only the requested columns are read
+    df = pd.concat([pq.read_table(part, columns=columns).to_pandas() for part in parts], ignore_index=True)
+    df = df.astype({col: dtype for col, dtype in PRICE_DTYPES.items() if col in columns})
+    # Later parts may re-deliver the last (still open) candle, keep the newest copy
+    return sort_and_dedupe(df)
+
+def _verify_one(asset, file_path, parts=None):
+    """Check one asset's stored data, returning (log level, message) pairs.
+    
+    Module-level so it can run in a worker process; parts is the Parquet part list,
+    or None for a CSV file.
+    """
+    try:
+        # Only the column names and the timestamp column are needed, never the prices
+        if parts is not None:
+            columns = pq.read_schema(parts[0]).names if parts else []
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                columns = [col for col in f.readline().rstrip('\r\n').split(',') if col]
+        
+        if not columns:
+            return [(logging.WARNING, f"WARNING {asset}: Empty data file")]
+        
+        # Check for required columns
+        missing_cols = [col for col in STORED_COLUMNS if col not in columns]
+        
+        if missing_cols:
+            return [(logging.WARNING, f"WARNING {asset}: Missing columns {missing_cols}")]
+        
+        if parts is not None:
+            # Later parts may re-deliver the last (still open) candle; np.unique drops
+            # those copies and sorts in one go
+            t = np.unique(np.concatenate([
+                pq.read_table(part, columns=['timestamp']).column('timestamp').to_numpy().astype('datetime64[ns]')
+                for part in parts
+            ]).view('int64'))
+        else:
+            t = read_csv_timestamps(file_path).view('int64')
+            if len(t) > 1 and np.any(t[1:] < t[:-1]):
+                t = np.sort(t)
+        
+        if len(t) == 0:
+            return [(logging.WARNING, f"WARNING {asset}: Empty data file")]
+        
+        # Check for data gaps on the raw int64 nanoseconds: plain NumPy
+        # ufuncs, no Timedelta Series and no full-frame sort
+        first, last = pd.Timestamp(t[0]), pd.Timestamp(t[-1])
+        
+        # Calculate date range
+        date_range = (last - first).days
+        
+        messages = []
+        gaps = np.count_nonzero(np.diff(t) > MAX_GAP_NS)
+        
+        if gaps > 0:
+            messages.append((logging.WARNING, f"WARNING {asset}: Found {gaps} data gaps"))
+        
+        messages.append((logging.INFO, f"VERIFIED {asset}: {len(t)} candles, {date_range} days, {first} to {last}"))
+        return messages
+        
+    except Exception as e:
+        return [(logging.ERROR, f"ERROR verifying {asset}: {str(e)}")]
+
+def json_dumps(obj, pretty=False):
+    """Encode to JSON bytes, in native code when orjson is available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=(orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS) if pretty else None)
+    if pretty:
+        return json.dumps(obj, indent=2, sort_keys=True).encode()
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+def json_loads(data):
+    """Decode JSON bytes, in native code when orjson is available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def find_existing_data_files():
+    """List existing per-asset data files (or Parquet partitions) in the downloads folder"""
+    if STORAGE_FORMAT == 'parquet':
+        dataset_path = os.path.join(DOWNLOADS_FOLDER, PARQUET_DATASET)
+        if not os.path.exists(dataset_path):
+            return []
+        return [f for f in os.listdir(dataset_path) if f.startswith('asset=')]
+    return [f for f in os.listdir(DOWNLOADS_FOLDER) if f.endswith('_ohlc_30.csv')]
 
 class HyperliquidOHLCPuller:
     def __init__(self):
-        self.info = Info(BASE_URL)
+        # Coin names are spliced unescaped into the candleSnapshot payload template below
+        invalid = [s for s in map(get_hyperliquid_symbol, ASSETS) if not (s.isascii() and s.isalnum())]
+        if invalid:
+            raise ValueError(f"Coin names must be ASCII identifiers to be spliced into the payload template: {invalid}")
+        
         self.downloads_folder = DOWNLOADS_FOLDER
         self.available_symbols = None
+        self.available_assets = None  # Our assets whose Hyperliquid symbol is listed
+        # A small burst plus a minute of refill adds up to exactly the per-minute budget,
+        # so no 60 s window can spend more than RATE_LIMIT_WEIGHT
+        self.rate_limiter = RateLimiter((RATE_LIMIT_WEIGHT - RATE_LIMIT_BURST) / 60, capacity=RATE_LIMIT_BURST)
+        self.cursor_file = os.path.join(self.downloads_folder, CURSOR_FILE)
+        self.symbols_cache_file = os.path.join(self.downloads_folder, SYMBOLS_CACHE_FILE)
+        self.cycle_now_ms = None  # Fixed "now" (epoch ms) for the duration of an update cycle
+        
+        # Parquet saves made during a cycle are queued and written as one dataset batch
+        self.defer_parquet_writes = False
+        self.pending_parquet = []
+        self.pending_lock = threading.Lock()
+        
+        # Shared keep-alive HTTP session: metadata and candle requests all go to
+        # the same host, so concurrent workers reuse pooled connections instead
+        # of paying a TLS handshake per request
+        headers = {
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'User-Agent': 'hyperliquid-ohlc-puller'
+        }
+        if USE_HTTP2:
+            # One TLS connection carrying every worker's requests as HTTP/2 streams
+            self.session = httpx.Client(
+                headers=headers,
+                timeout=REQUEST_TIMEOUT,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=3,  # connection failures only; status codes aren't retried
+                    limits=httpx.Limits(max_connections=1, max_keepalive_connections=1)
+                )
+            )
+        else:
+            # 429s are left to the shared rate limiter, which pauses every worker
+            # rather than only the thread whose request was rejected
+            retries = Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=None,  # /info is a read-only POST, safe to retry
+                respect_retry_after_header=False,  # or urllib3 would retry 429s itself, outside the limiter
+                raise_on_status=False
+            )
+            self.session = requests.Session()
+            # One pooled socket per thread that can be mid-request (asset workers plus
+            # chunk workers), so raising either never spills into throwaway connections
+            self.session.mount('https://', HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=MAX_WORKERS + CHUNK_WORKERS,
+                max_retries=retries
+            ))
+            self.session.headers.update(headers)
+        
+        # Every request goes to the same endpoint
+        self.info_url = f"{BASE_URL}/info"
+        
+        # candleSnapshot body serialized once; only coin and the time bounds vary per call.
+        # Splicing raw bytes is safe because coin names are plain ASCII identifiers.
+        self.candle_payload_template = (
+            b'{"type":"candleSnapshot","req":{"coin":"__COIN__","interval":"%s",'
+            b'"startTime":__START__,"endTime":__END__}}' % INTERVAL.encode()
+        )
         
         # Ensure downloads folder exists
         if not os.path.exists(self.downloads_folder):
@@ -73,19 +524,111 @@ class HyperliquidOHLCPuller:
             
         logging.info(f"Initialized Hyperliquid OHLC Puller")
         logging.info(f"Downloads folder: {self.downloads_folder}")
+        logging.info(f"Storage format: {STORAGE_FORMAT}")
         logging.info(f"Tracking {len(ASSETS)} assets")
         logging.info(f"Historical data period: {HISTORICAL_DAYS} days")
         
+        self.cursors = self.load_cursors()
+        
+        # Chunk fetches of full-history pulls run here, separate from the asset
+        # pool so an asset worker never waits on a slot its own pool holds
+        self.chunk_executor = ThreadPoolExecutor(max_workers=CHUNK_WORKERS)
+        
+        if STORAGE_FORMAT == 'parquet':
+            self.migrate_csv_to_parquet()
+        
         # Get available symbols from exchange
         self.get_available_symbols()
+    
+    def post_info(self, body):
+        """POST an encoded JSON body to the /info endpoint over the shared session"""
+        if USE_HTTP2:
+            return self.session.post(self.info_url, content=body)
+        return self.session.post(self.info_url, data=body, timeout=REQUEST_TIMEOUT)
+    
+    def close(self):
+        """Close the HTTP session and release pooled connections"""
+        self.chunk_executor.shutdown(wait=True)
+        self.session.close()
+        
+    def now_ms(self):
+        """Current epoch time in ms, held fixed while an update cycle is running"""
+        return self.cycle_now_ms or epoch_ms()
+    
+    def load_cursors(self):
+        """Load the latest saved timestamp per asset so updates don't have to parse data files.
         
+        Cursors are kept per storage format: CSV files and the Parquet dataset are
+        updated independently, so one's watermark says nothing about the other.
+        """
+        self.cursor_sections = {}
+        if os.path.exists(self.cursor_file):
+            try:
+                with open(self.cursor_file, 'rb') as f:
+                    sections = json_loads(f.read())
+                if all(isinstance(section, dict) for section in sections.values()):
+                    self.cursor_sections = sections
+                else:
+                    # Older flat file: unknown which storage it tracked, so rebuild from the data
+                    logging.info("Ignoring cursor file without per-format sections, reading data files instead")
+            except Exception as e:
+                logging.warning(f"Error loading cursor file: {str(e)}")
+        return dict(self.cursor_sections.get(STORAGE_FORMAT, {}))
+    
+    def save_cursors(self):
+        """Persist the per-asset cursors, keeping the other storage format's section"""
+        try:
+            self.cursor_sections[STORAGE_FORMAT] = self.cursors
+            # Serialize once and write the bytes in a single call
+            with atomic_write(self.cursor_file) as f:
+                f.write(json_dumps(self.cursor_sections, pretty=True))
+        except Exception as e:
+            logging.error(f"Error saving cursor file: {str(e)}")
+    
+    def update_cursor(self, asset, timestamp):
+        """Record the latest saved timestamp for an asset"""
+        self.cursors[asset] = int(pd.Timestamp(timestamp).value // 10**6)
+    
+    def load_symbols_cache(self):
+        """Seed the in-process symbol cache from the sidecar file of an earlier run"""
+        if not os.path.exists(self.symbols_cache_file):
+            return
+        try:
+            with open(self.symbols_cache_file, 'rb') as f:
+                cached = json_loads(f.read())
+            _META_CACHE['symbols'] = frozenset(cached['symbols'])
+            _META_CACHE['ts'] = float(cached['ts'])
+        except Exception as e:
+            logging.warning(f"Error loading symbol cache file: {str(e)}")
+    
+    def save_symbols_cache(self):
+        """Persist the symbol cache for later runs"""
+        try:
+            with atomic_write(self.symbols_cache_file) as f:
+                f.write(json_dumps({'symbols': sorted(_META_CACHE['symbols']), 'ts': _META_CACHE['ts']}, pretty=True))
+        except Exception as e:
+            logging.error(f"Error saving symbol cache file: {str(e)}")
+    
     def get_available_symbols(self):
         """Get list of available symbols from Hyperliquid"""
+        if _META_CACHE['symbols'] is None:
+            self.load_symbols_cache()
+        
+        age = time.time() - _META_CACHE['ts']
+        if _META_CACHE['symbols'] is not None and age < META_CACHE_TTL:
+            self.available_symbols = set(_META_CACHE['symbols'])
+            self.available_assets = self.match_available_assets()
+            logging.info(f"Using cached symbol list: {len(self.available_symbols)} symbols, fetched {int(age // 60)} min ago")
+            return
+        
         try:
             logging.info("Fetching available symbols from Hyperliquid...")
             
-            # Get market metadata
-            meta = self.info.meta()
+            # Get market metadata over the shared session
+            self.rate_limiter.acquire(INFO_REQUEST_WEIGHT)
+            response = self.post_info(json_dumps({'type': 'meta'}))
+            response.raise_for_status()
+            meta = json_loads(response.content)
             
             if meta and 'universe' in meta:
                 self.available_symbols = set()
@@ -94,54 +637,102 @@ class HyperliquidOHLCPuller:
                         self.available_symbols.add(asset_info['name'])
                 
                 logging.info(f"Found {len(self.available_symbols)} available symbols")
+                _META_CACHE['symbols'] = frozenset(self.available_symbols)
+                _META_CACHE['ts'] = time.time()
+                self.save_symbols_cache()
                 
                 # Check which of our assets are available
-                available_count = 0
-                missing_assets = []
+                self.available_assets = self.match_available_assets()
+                missing_assets = [f"{asset} ({get_hyperliquid_symbol(asset)})" for asset in ASSETS if asset not in self.available_assets]
                 
-                for asset in ASSETS:
-                    hl_symbol = get_hyperliquid_symbol(asset)
-                    if hl_symbol in self.available_symbols:
-                        available_count += 1
-                    else:
-                        missing_assets.append(f"{asset} ({hl_symbol})")
-                
-                logging.info(f"Available assets: {available_count}/{len(ASSETS)}")
+                logging.info(f"Available assets: {len(self.available_assets)}/{len(ASSETS)}")
                 if missing_assets:
                     logging.warning(f"Missing assets: {missing_assets}")
                     
             else:
                 logging.error("Failed to get market metadata")
                 self.available_symbols = set()
+                self.available_assets = frozenset()
                 
         except Exception as e:
             logging.error(f"Error getting available symbols: {str(e)}")
             logging.error(traceback.format_exc())
             self.available_symbols = set()
+            self.available_assets = frozenset()
+    
+    def match_available_assets(self):
+        """Resolve which tracked assets are listed, once per symbol list"""
+        return frozenset(asset for asset in ASSETS if get_hyperliquid_symbol(asset) in self.available_symbols)
     
     def is_symbol_available(self, asset):
         """Check if a symbol is available on Hyperliquid"""
-        if self.available_symbols is None:
+        if self.available_assets is None:
             return True  # If we couldn't get the list, assume it's available
         
-        hl_symbol = get_hyperliquid_symbol(asset)
-        return hl_symbol in self.available_symbols
+        return asset in self.available_assets
         
     def get_file_path(self, asset):
-        """Get the file path for an asset's OHLC data"""
+        """Get the file path for an asset's OHLC data (the partition directory for Parquet)"""
+        if STORAGE_FORMAT == 'parquet':
+            return os.path.join(self.downloads_folder, PARQUET_DATASET, f"asset={asset}")
         filename = f"{asset}_ohlc_30.csv"
         return os.path.join(self.downloads_folder, filename)
     
+    def get_parquet_parts(self, asset):
+        """Get an asset's Parquet part files in write order"""
+        partition_path = self.get_file_path(asset)
+        if not os.path.exists(partition_path):
+            return []
+        # Part names start with the zero-padded write time, so name order is write order
+        return sorted(os.path.join(partition_path, f) for f in os.listdir(partition_path) if f.endswith('.parquet'))
+    
+    def migrate_csv_to_parquet(self):
+        """One-shot import of legacy per-asset CSV files into the Parquet dataset"""
+        pending = []
+        for asset in ASSETS:
+            csv_path = os.path.join(self.downloads_folder, f"{asset}_ohlc_30.csv")
+            # Assets that already have Parquet parts were migrated (or rebuilt) before
+            if not os.path.exists(csv_path) or self.get_parquet_parts(asset):
+                continue
+            try:
+                df = read_csv_data(csv_path)
+                if len(df) == 0:
+                    # Header-only file: nothing to import, and an empty frame writes no partition
+                    logging.info(f"Skipping empty {csv_path} during Parquet migration")
+                    continue
+                pending.append((asset, df, True))
+            except Exception as e:
+                logging.warning(f"Could not migrate {csv_path} to Parquet: {str(e)}")
+        
+        if not pending:
+            return
+        
+        logging.info(f"Migrating {len(pending)} CSV files into {PARQUET_DATASET}...")
+        with self.pending_lock:
+            self.pending_parquet.extend(pending)
+        migrated = self.flush_parquet_writes()
+        # Assets that did make it in have advanced cursors either way
+        self.save_cursors()
+        if migrated:
+            logging.info("CSV migration complete - the original CSV files were left in place")
+    
     def load_existing_data(self, asset):
         """Load existing data for an asset"""
         file_path = self.get_file_path(asset)
         
+        if STORAGE_FORMAT == 'parquet':
+            parts = self.get_parquet_parts(asset)
+            if not parts:
+                return None
+            try:
+                return read_parquet_parts(parts)
+            except Exception as e:
+                logging.warning(f"Error loading existing data for {asset}: {str(e)}")
+                return None
+        
         if os.path.exists(file_path):
             try:
-                df = pd.read_csv(file_path)
-                # Parse timestamp with explicit format to ensure proper date/time handling
-                df['timestamp'] = pd.to_datetime(df['timestamp'], format='%Y-%m-%d %H:%M:%S')
-                return df
+                return read_csv_data(file_path)
             except Exception as e:
                 logging.warning(f"Error loading existing data for {asset}: {str(e)}")
                 return None
@@ -153,21 +744,90 @@ class HyperliquidOHLCPuller:
             return existing_df['timestamp'].max()
         return None
     
+    def load_latest_timestamp(self, asset):
+        """Get the latest stored timestamp for an asset without loading more than needed"""
+        last_ms = self.cursors.get(asset)
+        if last_ms:
+            return pd.Timestamp(last_ms, unit='ms')
+        
+        if STORAGE_FORMAT == 'parquet':
+            parts = self.get_parquet_parts(asset)
+            if not parts:
+                return None
+            try:
+                # Only the timestamp column of the listed part files is read, so stray
+                # .tmp files in the partition directory are never picked up
+                timestamps = read_parquet_parts(parts, columns=['timestamp'])['timestamp']
+                if len(timestamps) == 0:
+                    return None
+                return timestamps.iloc[-1]
+            except Exception as e:
+                logging.warning(f"Error reading latest timestamp for {asset}: {str(e)}")
+                return None
+        
+        file_path = self.get_file_path(asset)
+        if not os.path.exists(file_path):
+            return None
+        
+        try:
+            # Files are sorted on write, so the newest candle is the last line: read
+            # only the file's tail instead of parsing the whole CSV
+            return self.read_last_timestamp(file_path)
+        except (OSError, UnicodeDecodeError, ValueError):
+            return self.get_latest_timestamp(self.load_existing_data(asset))
+    
+    def read_last_timestamp(self, file_path):
+        """Parse the timestamp of a CSV's last row (raises ValueError if there is none)"""
+        _, last_line = self.read_last_line(file_path)
+        return parse_csv_row_timestamp(last_line)
+    
+    def load_timestamp_range(self, asset):
+        """Get the (earliest, latest) stored timestamps for an asset, or None if there is no data"""
+        if STORAGE_FORMAT == 'parquet':
+            parts = self.get_parquet_parts(asset)
+            if not parts:
+                return None
+            try:
+                # Only the timestamp column of the listed part files is read
+                timestamps = read_parquet_parts(parts, columns=['timestamp'])['timestamp']
+                if len(timestamps) == 0:
+                    return None
+                return timestamps.iloc[0], timestamps.iloc[-1]
+            except Exception as e:
+                logging.warning(f"Error reading timestamps for {asset}: {str(e)}")
+                return None
+        
+        file_path = self.get_file_path(asset)
+        if not os.path.exists(file_path):
+            return None
+        
+        try:
+            # Files are sorted on write: the first data row is the oldest candle and
+            # the last line the newest, so only the head and tail are read
+            with open(file_path, 'r', encoding='utf-8') as f:
+                f.readline()  # header
+                first_timestamp = parse_csv_row_timestamp(f.readline())
+            return first_timestamp, self.read_last_timestamp(file_path)
+        except (OSError, UnicodeDecodeError, ValueError):
+            existing_data = self.load_existing_data(asset)
+            if existing_data is None or len(existing_data) == 0:
+                return None
+            return existing_data['timestamp'].min(), existing_data['timestamp'].max()
+    
     def should_rebuild_data(self, asset):
         """Check if existing data should be rebuilt (if it only has limited historical data)"""
-        existing_data = self.load_existing_data(asset)
+        timestamp_range = self.load_timestamp_range(asset)
         
-        if existing_data is None or len(existing_data) == 0:
+        if timestamp_range is None:
             logging.info(f"{asset}: No existing data, will fetch {HISTORICAL_DAYS} days")
             return True  # No data, need to build
         
         # Calculate the date range of existing data
-        min_date = existing_data['timestamp'].min()
-        max_date = existing_data['timestamp'].max()
+        min_date, max_date = timestamp_range
         date_range = (max_date - min_date).days
         
         # Calculate how far back the data goes from today
-        days_from_today = (datetime.now() - min_date).days
+        days_from_today = (pd.Timestamp(self.now_ms(), unit='ms') - min_date).days
         
         # If data spans less than 250 days OR doesn't go back far enough, rebuild
         # (250 days accounts for weekends, holidays, market closures, etc.)
@@ -186,23 +846,22 @@ class HyperliquidOHLCPuller:
         hl_symbol = get_hyperliquid_symbol(asset)
         
         try:
-            api_url = f"{BASE_URL}/info"
-            
-            payload = {
-                "type": "candleSnapshot",
-                "req": {
-                    "coin": hl_symbol,
-                    "interval": INTERVAL,
-                    "startTime": start_time_ms,
-                    "endTime": end_time_ms
-                }
-            }
+            body = (self.candle_payload_template
+                    .replace(b'__COIN__', hl_symbol.encode())
+                    .replace(b'__START__', b'%d' % start_time_ms)
+                    .replace(b'__END__', b'%d' % end_time_ms))
             
-            response = requests.post(api_url, json=payload, headers={'Content-Type': 'application/json'})
+            for attempt in range(RATE_LIMIT_RETRIES):
+                self.rate_limiter.acquire(INFO_REQUEST_WEIGHT)
+                # The session already sends the JSON content type
+                response = self.post_info(body)
+                if not self.check_rate_limit(asset, response):
+                    break
             
             if response.status_code == 200:
-                candles = response.json()
+                candles = json_loads(response.content)
                 if candles and isinstance(candles, list):
+                    self.rate_limiter.charge(len(candles) // CANDLES_PER_WEIGHT)
                     return candles
                 else:
                     return []
@@ -214,8 +873,68 @@ class HyperliquidOHLCPuller:
             logging.error(f"HTTP request failed for {asset}: {str(e)}")
             return None
 
-    def fetch_candle_data(self, asset, start_time=None, force_full_history=False):
-        """Fetch candle data from Hyperliquid using chunked requests to bypass API limits"""
+    def check_rate_limit(self, asset, response):
+        """Feed rate-limit signals back into the limiter; True if the request was rejected (429)"""
+        headers = response.headers
+        
+        if response.status_code == 429:
+            delay = self.rate_limiter.backoff(parse_retry_after(headers.get('Retry-After')))
+            logging.warning(f"Rate limited fetching {asset}, pausing requests for {delay:g}s")
+            return True
+        
+        # Quota exhausted but this request still went through: wait for the window to reset
+        remaining = headers.get('x-ratelimit-remaining')
+        if remaining is not None and remaining.strip() == '0':
+            delay = self.rate_limiter.backoff(parse_retry_after(headers.get('x-ratelimit-reset')))
+            logging.info(f"Rate limit quota used up, pausing requests for {delay:g}s")
+        else:
+            self.rate_limiter.reset_backoff()
+        return False
+    
+    def parse_candles(self, asset, candles):
+        """Convert raw API candles into an OHLC DataFrame in one vectorized pass"""
+        # Format: {'t': start_time, 'T': end_time, 's': symbol, 'i': interval,
+        #          'o': open, 'c': close, 'h': high, 'l': low, 'v': volume, 'n': trades}
+        try:
+            # Fast path: gather each field with a list comprehension and let NumPy's C
+            # string-to-float conversion fill the typed column, no per-value float() call
+            columns = {
+                name: np.asarray([c[name] for c in candles], dtype=OHLC_DTYPE[name])
+                for name in OHLC_DTYPE.names
+            }
+        except (KeyError, TypeError, ValueError):
+            # Malformed candles: numeric fields arrive as strings, coerce the whole
+            # sub-frame at once and drop the rows that don't parse
+            raw = pd.DataFrame([c for c in candles if isinstance(c, dict)], columns=list(OHLC_DTYPE.names))
+            raw = raw.apply(pd.to_numeric, errors='coerce')
+            
+            invalid = raw.isna().any(axis=1)
+            if invalid.any():
+                logging.warning(f"Skipping {int(invalid.sum())} malformed candles for {asset}")
+                raw = raw[~invalid]
+            
+            columns = {name: raw[name].to_numpy(dtype=OHLC_DTYPE[name]) for name in OHLC_DTYPE.names}
+        
+        if len(columns['T']) == 0:
+            return None
+        
+        # Assemble the frame in one construction straight from the column arrays,
+        # with no intermediate record frame, rename or column re-assignment
+        return pd.DataFrame({
+            # Use 'T' (end time), truncated to the whole seconds we store
+            'timestamp': pd.to_datetime(columns['T'] // 1000 * 1000, unit='ms'),
+            'open': columns['o'],
+            'high': columns['h'],
+            'low': columns['l'],
+            'close': columns['c'],
+            'volume': columns['v'],
+        })
+    
+    def fetch_candle_data(self, asset, start_time_ms=None, force_full_history=False):
+        """Fetch candle data from Hyperliquid using chunked requests to bypass API limits.
+        
+        Times are UTC epoch milliseconds, as the API expects.
+        """
         try:
             hl_symbol = get_hyperliquid_symbol(asset)
             
@@ -225,59 +944,58 @@ class HyperliquidOHLCPuller:
                 return None
             
             # Calculate start time
-            if start_time is None or force_full_history:
+            end_time_ms = self.now_ms()
+            
+            if start_time_ms is None or force_full_history:
                 # Get full historical data
-                start_time = datetime.now() - timedelta(days=HISTORICAL_DAYS)
-                logging.info(f"Fetching {asset} ({hl_symbol}) - FULL {HISTORICAL_DAYS} days from {start_time}")
+                start_time_ms = end_time_ms - HISTORICAL_DAYS * DAY_MS
+                logging.info(f"Fetching {asset} ({hl_symbol}) - FULL {HISTORICAL_DAYS} days from {pd.Timestamp(start_time_ms, unit='ms')}")
             else:
-                logging.info(f"Fetching {asset} ({hl_symbol}) - UPDATE from {start_time}")
-            
-            end_time = datetime.now()
+                logging.info(f"Fetching {asset} ({hl_symbol}) - UPDATE from {pd.Timestamp(start_time_ms, unit='ms')}")
             
             # For full history, use chunked requests to bypass API limits
-            if force_full_history or (start_time and (end_time - start_time).days > 50):
+            if force_full_history or end_time_ms - start_time_ms > 50 * DAY_MS:
                 logging.info(f"Using chunked requests for {asset} to get full historical data...")
                 
                 # Split into 45-day chunks (to stay safely under API limits)
-                chunk_days = 45
+                chunk_ms = 45 * DAY_MS
+                bounds = [
+                    (chunk_start, min(chunk_start + chunk_ms, end_time_ms))
+                    for chunk_start in range(start_time_ms, end_time_ms, chunk_ms)
+                ]
+                
+                # Request every chunk at once; the shared rate limiter still paces them
+                futures = [
+                    self.chunk_executor.submit(self.fetch_candle_data_chunk, asset, chunk_start, chunk_end)
+                    for chunk_start, chunk_end in bounds
+                ]
+                
                 all_candles = []
-                current_start = start_time
                 chunk_count = 0
                 
-                while current_start < end_time:
+                # Consume in chronological order so a failed chunk still truncates the history there
+                for (chunk_start, chunk_end), future in zip(bounds, futures):
                     chunk_count += 1
-                    current_end = min(current_start + timedelta(days=chunk_days), end_time)
-                    
-                    start_time_ms = int(current_start.timestamp() * 1000)
-                    end_time_ms = int(current_end.timestamp() * 1000)
+                    logging.info(f"  {asset} chunk {chunk_count}: {pd.Timestamp(chunk_start, unit='ms'):%Y-%m-%d} to {pd.Timestamp(chunk_end, unit='ms'):%Y-%m-%d}")
                     
-                    logging.info(f"  Chunk {chunk_count}: {current_start.strftime('%Y-%m-%d')} to {current_end.strftime('%Y-%m-%d')}")
-                    
-                    chunk_candles = self.fetch_candle_data_chunk(asset, start_time_ms, end_time_ms)
+                    chunk_candles = future.result()
                     
                     if chunk_candles is None:
                         logging.error(f"Failed to fetch chunk {chunk_count} for {asset}")
+                        for pending in futures[chunk_count:]:
+                            pending.cancel()
                         break
                     elif len(chunk_candles) > 0:
                         all_candles.extend(chunk_candles)
                         logging.info(f"  Got {len(chunk_candles)} candles from chunk {chunk_count}")
                     else:
                         logging.info(f"  No data in chunk {chunk_count}")
-                    
-                    # Move to next chunk
-                    current_start = current_end
-                    
-                    # Small delay between chunks to be respectful to the API
-                    time.sleep(0.5)
                 
                 candles = all_candles
                 logging.info(f"Total candles fetched for {asset}: {len(candles)} from {chunk_count} chunks")
                 
             else:
                 # Single request for smaller time ranges
-                start_time_ms = int(start_time.timestamp() * 1000)
-                end_time_ms = int(end_time.timestamp() * 1000)
-                
                 candles = self.fetch_candle_data_chunk(asset, start_time_ms, end_time_ms)
                 
                 if candles is None:
@@ -289,46 +1007,18 @@ class HyperliquidOHLCPuller:
                 logging.warning(f"No candle data returned for {asset}")
                 return None
             
-            # Convert to DataFrame using the working format from the test
-            df_data = []
-            for candle in candles:
-                try:
-                    if isinstance(candle, dict):
-                        # Use the exact field mapping that worked in the test
-                        # Format: {'t': start_time, 'T': end_time, 's': symbol, 'i': interval, 
-                        #          'o': open, 'c': close, 'h': high, 'l': low, 'v': volume, 'n': trades}
-                        
-                        # Convert timestamp to datetime with proper formatting
-                        timestamp = pd.to_datetime(int(candle['T']), unit='ms')  # Use 'T' (end time)
-                        open_price = float(candle['o'])
-                        high_price = float(candle['h'])
-                        low_price = float(candle['l'])
-                        close_price = float(candle['c'])
-                        volume = float(candle['v'])
-
-                        df_data.append({
-                            'timestamp': timestamp,
-                            'open': open_price,
-                            'high': high_price,
-                            'low': low_price,
-                            'close': close_price,
-                            'volume': volume,
-                            'asset': asset,
-                            'hl_symbol': hl_symbol
-                        })
-                        
-                except Exception as e:
-                    logging.warning(f"Error processing candle for {asset}: {str(e)}")
-                    continue
+            df = self.parse_candles(asset, candles)
             
-            if not df_data:
+            if df is None:
                 logging.warning(f"No valid candle data processed for {asset}")
                 return None
             
-            df = pd.DataFrame(df_data)
-            # Remove duplicates and sort
-            df = df.drop_duplicates(subset=['timestamp'], keep='last')
-            df = df.sort_values('timestamp').reset_index(drop=True)
+            # Remove duplicates (chunk boundaries repeat one candle) and sort. Chunks
+            # arrive in time order, so the sort is normally skipped.
+            df = df[~df['timestamp'].duplicated(keep='last')]
+            if not df['timestamp'].is_monotonic_increasing:
+                df = df.sort_values('timestamp')
+            df = df.reset_index(drop=True)
             
             # Calculate actual date range
             if len(df) > 0:
@@ -344,9 +1034,189 @@ class HyperliquidOHLCPuller:
             logging.error(traceback.format_exc())
             return None
     
+    def save_parquet_data(self, asset, new_data, replace_existing=False):
+        """Queue data for the asset's Parquet partition (replace it, or append a new part)"""
+        if new_data is None or len(new_data) == 0:
+            logging.info(f"No candles to save for {asset}, leaving its Parquet partition unchanged")
+            return True
+        
+        with self.pending_lock:
+            self.pending_parquet.append((asset, new_data, replace_existing))
+        
+        if not self.defer_parquet_writes:
+            return self.flush_parquet_writes()
+        
+        logging.info(f"Queued {len(new_data)} candles for {asset}")
+        return True
+    
+    def flush_parquet_writes(self):
+        """Write all queued Parquet data in a single dataset write"""
+        with self.pending_lock:
+            pending, self.pending_parquet = self.pending_parquet, []
+        
+        if not pending:
+            return True
+        
+        dataset_path = os.path.join(self.downloads_folder, PARQUET_DATASET)
+        staging_path = dataset_path + '.staging'
+        write_ms = int(time.time() * 1000)
+        
+        try:
+            table = pa.Table.from_pandas(
+                pd.concat([data[STORED_COLUMNS].assign(asset=asset) for asset, data, _ in pending], ignore_index=True),
+                preserve_index=False
+            )
+            
+            # Write every partition in one go into a staging directory, then move the
+            # finished part files into place so readers never see a partial file
+            shutil.rmtree(staging_path, ignore_errors=True)
+            ds.write_dataset(
+                table,
+                staging_path,
+                format='parquet',
+                partitioning=['asset'],
+                partitioning_flavor='hive',
+                file_options=ds.ParquetFileFormat().make_write_options(compression=PARQUET_COMPRESSION),
+                basename_template=f"part-{write_ms:013d}-{{i}}.parquet"
+            )
+            
+        except Exception as e:
+            logging.error(f"Error writing Parquet batch for {len(pending)} assets: {str(e)}")
+            logging.error(traceback.format_exc())
+            return False
+        
+        # Each asset is committed on its own, so one bad partition can't leave the
+        # rest of the batch half applied; only committed assets advance their cursor
+        failed = []
+        for asset, data, replace_existing in pending:
+            try:
+                partition_path = self.get_file_path(asset)
+                staged_path = os.path.join(staging_path, os.path.basename(partition_path))
+                if len(data) == 0:
+                    logging.info(f"No candles staged for {asset}, skipping")
+                    continue
+                if not os.path.isdir(staged_path):
+                    logging.error(f"No staged Parquet data for {asset}, skipping")
+                    failed.append(asset)
+                    continue
+                os.makedirs(partition_path, exist_ok=True)
+                
+                # Rebuilds drop the old parts; updates only add a part with the new rows
+                old_parts = self.get_parquet_parts(asset) if replace_existing else []
+                for part in os.listdir(staged_path):
+                    os.replace(os.path.join(staged_path, part), os.path.join(partition_path, part))
+                for part in old_parts:
+                    os.remove(part)
+                
+                if replace_existing:
+                    logging.info(f"Replaced data for {asset}: {len(data)} candles")
+                else:
+                    logging.info(f"Appended {len(data)} candles for {asset}")
+                    self.compact_parquet_partition(asset, write_ms)
+                self.update_cursor(asset, data['timestamp'].max())
+            except Exception as e:
+                logging.error(f"Error committing Parquet data for {asset}: {str(e)}")
+                failed.append(asset)
+        
+        shutil.rmtree(staging_path, ignore_errors=True)
+        logging.info(f"Wrote Parquet batch: {table.num_rows} candles for {len(pending) - len(failed)}/{len(pending)} assets")
+        return not failed
+    
+    def compact_parquet_partition(self, asset, write_ms):
+        """Merge an asset's part files into one once enough appends have piled up"""
+        parts = self.get_parquet_parts(asset)
+        if len(parts) < PARQUET_COMPACT_PARTS:
+            return
+        
+        # Sorts after this batch's part-<write_ms>-<i> files and before any later write
+        compact_path = os.path.join(self.get_file_path(asset), f"part-{write_ms:013d}-compact.parquet")
+        try:
+            df = read_parquet_parts(parts)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            with atomic_write(compact_path) as f:
+                pq.write_table(table, f, compression=PARQUET_COMPRESSION)
+        except Exception as e:
+            # The appended parts are intact, so this only postpones the compaction
+            logging.warning(f"Could not compact Parquet parts for {asset}: {str(e)}")
+            return
+        
+        for part in parts:
+            os.remove(part)
+        logging.info(f"Compacted {len(parts)} Parquet parts for {asset} into one ({len(df)} candles)")
+    
+    def read_last_line(self, file_path, block_size=4096):
+        """Read the last non-empty line of a file, returning (byte offset, line)"""
+        with open(file_path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            start = max(0, size - block_size)
+            f.seek(start)
+            tail = f.read().rstrip(b'\r\n')
+        line_start = tail.rfind(b'\n') + 1
+        return start + line_start, tail[line_start:].decode('utf-8').rstrip('\r')
+    
+    def append_csv_data(self, asset, new_data):
+        """Append new candles to an existing CSV without reading or rewriting its history.
+        
+        Returns False if the new data can't simply be appended (overlap beyond the
+        last stored candle or a different column layout), so the caller can merge.
+        """
+        file_path = self.get_file_path(asset)
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            header = f.readline().rstrip('\r\n').split(',')
+        if header != STORED_COLUMNS:
+            return False  # e.g. an older file with asset/hl_symbol columns: the merge rewrites it
+        
+        last_line_offset, last_line = self.read_last_line(file_path)
+        try:
+            last_timestamp = parse_csv_row_timestamp(last_line)
+        except ValueError:
+            return False  # header only or a damaged last line
+        
+        first_new_timestamp = new_data['timestamp'].iloc[0]
+        if first_new_timestamp < last_timestamp:
+            return False
+        
+        if first_new_timestamp > last_timestamp + pd.Timedelta(milliseconds=INTERVAL_MS):
+            # The cursor was ahead of this file (e.g. a restored CSV): appending would
+            # leave a hole, so fetch again from the file's own last candle
+            logging.warning(f"{asset}: New data starts at {first_new_timestamp} but the file ends at {last_timestamp}, refetching the gap")
+            self.cursors.pop(asset, None)
+            new_data = self.fetch_candle_data(asset, last_timestamp.value // 10**6)
+            if new_data is None or len(new_data) == 0 or \
+                    new_data['timestamp'].iloc[0] > last_timestamp + pd.Timedelta(milliseconds=INTERVAL_MS):
+                raise ValueError(f"could not refetch {asset} candles after {last_timestamp}")
+            first_new_timestamp = new_data['timestamp'].iloc[0]
+        
+        if first_new_timestamp == last_timestamp:
+            # The last stored candle was still open when saved; replace it with the fresh copy
+            with open(file_path, 'r+b') as f:
+                f.truncate(last_line_offset)
+        
+        # A cycle appends only a handful of rows, where to_csv's setup dominates: format
+        # each column in one pass (numpy's str() matches to_csv's float output) and hand
+        # the rows straight to the C csv writer
+        columns = [new_data['timestamp'].dt.strftime(CSV_TIMESTAMP_FORMAT).tolist()]
+        columns += [new_data[col].to_numpy().astype(str).tolist() for col in STORED_COLUMNS[1:]]
+        with open(file_path, 'a', buffering=WRITE_BUFFER_SIZE, newline='', encoding='utf-8') as f:
+            csv.writer(f, lineterminator=CSV_LINE_TERMINATOR).writerows(zip(*columns))
+        
+        logging.info(f"Appended {len(new_data)} candles for {asset} after {last_timestamp}")
+        self.update_cursor(asset, new_data['timestamp'].max())
+        return True
+    
     def merge_and_save_data(self, asset, new_data, replace_existing=False):
         """Merge new data with existing data and save"""
         try:
+            if STORAGE_FORMAT == 'parquet':
+                return self.save_parquet_data(asset, new_data, replace_existing)
+            
+            if not replace_existing and os.path.exists(self.get_file_path(asset)):
+                # Fast path: candles are time-ordered, so an update is a plain append
+                if self.append_csv_data(asset, new_data):
+                    return True
+                logging.info(f"{asset}: New data overlaps stored history or the file has an old column layout, merging full file")
+            
             if replace_existing:
                 # Replace existing data entirely
                 combined_data = new_data
@@ -355,11 +1225,26 @@ class HyperliquidOHLCPuller:
                 # Merge with existing data
                 existing_data = self.load_existing_data(asset)
                 
-                if existing_data is not None:
-                    # Merge data, avoiding duplicates
-                    combined_data = pd.concat([existing_data, new_data], ignore_index=True)
-                    combined_data = combined_data.drop_duplicates(subset=['timestamp'], keep='last')
-                    combined_data = combined_data.sort_values('timestamp').reset_index(drop=True)
+                if existing_data is not None and existing_data['timestamp'].is_monotonic_increasing:
+                    # Both sides are already sorted (files are sorted on write, fetches
+                    # are sorted on parse), so splice the new block into the stored rows
+                    # around it: two binary searches, no hash dedupe or re-sort. New candles win.
+                    existing_timestamps = existing_data['timestamp'].to_numpy()
+                    new_timestamps = new_data['timestamp'].to_numpy()
+                    head = existing_timestamps.searchsorted(new_timestamps[0], side='left')
+                    tail = existing_timestamps.searchsorted(new_timestamps[-1], side='right')
+                    combined_data = pd.concat([
+                        existing_data.iloc[:head],
+                        new_data,
+                        existing_data.iloc[tail:]
+                    ], ignore_index=True)
+                    
+                    logging.info(f"Merged data for {asset}: {len(existing_data)} existing + {len(new_data)} new = {len(combined_data)} total")
+                elif existing_data is not None:
+                    # A hand-edited or damaged file can be out of order: fall back to a
+                    # full dedupe and sort, which also puts the file back in order
+                    logging.warning(f"{asset}: Stored data is out of order, re-sorting full history")
+                    combined_data = sort_and_dedupe(pd.concat([existing_data, new_data], ignore_index=True))
                     
                     logging.info(f"Merged data for {asset}: {len(existing_data)} existing + {len(new_data)} new = {len(combined_data)} total")
                 else:
@@ -368,9 +1253,13 @@ class HyperliquidOHLCPuller:
             
             # Save to CSV with proper timestamp formatting
             file_path = self.get_file_path(asset)
-            # Ensure timestamp is properly formatted before saving
-            combined_data['timestamp'] = pd.to_datetime(combined_data['timestamp']).dt.strftime('%Y-%m-%d %H:%M:%S')
-            combined_data.to_csv(file_path, index=False)
+            latest_timestamp = combined_data['timestamp'].max()
+            # Explicit large buffer: far fewer write() syscalls than the default 8 KiB.
+            # Timestamps are datetime64 on both sides of the merge, so the writer formats
+            # them directly instead of a separate strftime pass over the column.
+            with atomic_write(file_path, 'w', buffering=WRITE_BUFFER_SIZE, newline='', encoding='utf-8') as f:
+                combined_data.to_csv(f, index=False, columns=STORED_COLUMNS, date_format=CSV_TIMESTAMP_FORMAT,
+                                     lineterminator=CSV_LINE_TERMINATOR)
             
             # Log file size and date range
             if len(combined_data) > 0:
@@ -378,14 +1267,18 @@ class HyperliquidOHLCPuller:
                 end_date = combined_data['timestamp'].max()
                 logging.info(f"Saved {asset} data: {len(combined_data)} candles from {start_date} to {end_date}")
             
+            self.update_cursor(asset, latest_timestamp)
             return True
             
         except Exception as e:
             logging.error(f"Error saving data for {asset}: {str(e)}")
             return False
     
-    def update_single_asset(self, asset):
-        """Update data for a single asset with smart rebuilding"""
+    def update_single_asset(self, asset, should_rebuild=None):
+        """Update data for a single asset with smart rebuilding.
+        
+        should_rebuild can be passed in when the caller already ran should_rebuild_data.
+        """
         try:
             # Check if symbol is available first
             if not self.is_symbol_available(asset):
@@ -393,7 +1286,8 @@ class HyperliquidOHLCPuller:
                 return False
             
             # Check if we should rebuild the data (for short datasets)
-            should_rebuild = self.should_rebuild_data(asset)
+            if should_rebuild is None:
+                should_rebuild = self.should_rebuild_data(asset)
             
             if should_rebuild:
                 # Rebuild with full historical data
@@ -412,20 +1306,25 @@ class HyperliquidOHLCPuller:
                     return False
             else:
                 # Normal update - just get recent data
-                existing_data = self.load_existing_data(asset)
-                latest_timestamp = self.get_latest_timestamp(existing_data)
+                latest_timestamp = self.load_latest_timestamp(asset)
+                
+                # Stored candles are stamped with their (naive UTC) close time. If the
+                # newest one hasn't closed yet, nothing new can exist: skip the request.
+                if latest_timestamp and latest_timestamp > pd.Timestamp(self.now_ms(), unit='ms'):
+                    logging.info(f"{asset}: up-to-date (latest candle {latest_timestamp} still open), skipping fetch")
+                    return True
                 
                 if latest_timestamp:
                     # Start from the last timestamp to ensure we don't miss any data
-                    start_time = latest_timestamp
-                    logging.info(f"Updating {asset} from {start_time}")
+                    start_time_ms = latest_timestamp.value // 10**6
+                    logging.info(f"Updating {asset} from {latest_timestamp}")
                 else:
                     # No existing data, get full history
-                    start_time = datetime.now() - timedelta(days=HISTORICAL_DAYS)
-                    logging.info(f"Creating new data file for {asset} from {start_time}")
+                    start_time_ms = self.now_ms() - HISTORICAL_DAYS * DAY_MS
+                    logging.info(f"Creating new data file for {asset} from {pd.Timestamp(start_time_ms, unit='ms')}")
                 
                 # Fetch new data
-                new_data = self.fetch_candle_data(asset, start_time)
+                new_data = self.fetch_candle_data(asset, start_time_ms)
                 
                 if new_data is not None and len(new_data) > 0:
                     # Save the data
@@ -443,36 +1342,73 @@ class HyperliquidOHLCPuller:
             logging.error(f"ERROR: Updating {asset}: {str(e)}")
             return False
     
+    def process_asset(self, asset):
+        """Run the rebuild check and update for one asset (executed in a worker thread)"""
+        logging.info(f"Processing {asset}")
+        
+        # Check once whether this asset needs rebuilding; the update reuses the answer
+        needs_rebuild = self.should_rebuild_data(asset)
+        
+        return self.update_single_asset(asset, should_rebuild=needs_rebuild), needs_rebuild
+    
     def update_all_assets(self):
         """Update data for all assets"""
         start_time = datetime.now()
+        # Every asset in this cycle shares one "now" instead of re-reading the clock
+        self.cycle_now_ms = epoch_ms()
         logging.info(f"Starting update cycle for {len(ASSETS)} assets at {start_time}")
         
+        # A long-lived puller picks up new listings once the cached symbol list expires
+        self.get_available_symbols()
+        
         success_count = 0
         fail_count = 0
         rebuild_count = 0
         
-        for i, asset in enumerate(ASSETS, 1):
-            try:
-                logging.info(f"Processing {asset} ({i}/{len(ASSETS)})")
-                
-                # Check if this asset needs rebuilding
-                needs_rebuild = self.should_rebuild_data(asset)
-                if needs_rebuild:
-                    rebuild_count += 1
-                
-                if self.update_single_asset(asset):
-                    success_count += 1
-                else:
-                    fail_count += 1
-                    
-                # Delay between requests to avoid rate limiting
-                time.sleep(1.0)
-                
-            except Exception as e:
-                logging.error(f"Unexpected error processing {asset}: {str(e)}")
+        self.defer_parquet_writes = STORAGE_FORMAT == 'parquet'
+        
+        # Assets are network-bound, so fetch them concurrently; the shared
+        # rate limiter keeps the overall request rate polite
+        # Unlisted assets are settled here from the precomputed set, before a worker
+        # would open their files for the rebuild check
+        listed_assets = []
+        for asset in ASSETS:
+            if self.is_symbol_available(asset):
+                listed_assets.append(asset)
+            else:
+                logging.warning(f"Skipping {asset} - not available on Hyperliquid")
                 fail_count += 1
-                # Continue with next asset
+        
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {executor.submit(self.process_asset, asset): asset for asset in listed_assets}
+            
+            for i, future in enumerate(as_completed(futures), 1):
+                asset = futures[future]
+                try:
+                    success, needs_rebuild = future.result()
+                    if needs_rebuild:
+                        rebuild_count += 1
+                    
+                    if success:
+                        success_count += 1
+                    else:
+                        fail_count += 1
+                    
+                    logging.info(f"Finished {asset} ({i}/{len(futures)})")
+                    
+                except Exception as e:
+                    logging.error(f"Unexpected error processing {asset}: {str(e)}")
+                    fail_count += 1
+                    # Continue with next asset
+        
+        # One dataset write for every asset updated this cycle
+        self.defer_parquet_writes = False
+        if not self.flush_parquet_writes():
+            logging.error("Parquet batch write failed for some assets - their cursors were not advanced, data will be refetched next cycle")
+        
+        # Persist cursors once per cycle rather than per asset
+        self.save_cursors()
+        self.cycle_now_ms = None
         
         end_time = datetime.now()
         duration = end_time - start_time
@@ -484,72 +1420,91 @@ class HyperliquidOHLCPuller:
         if success_count + fail_count > 0:
             logging.info(f"   Success rate: {(success_count/(success_count+fail_count)*100):.1f}%")
         
+        # Don't leave the cycle's summary buffered until the next one
+        log_buffer.flush()
         return success_count, fail_count
     
+    def repair_data_files(self):
+        """Deduplicate, sort and rewrite every data file (manual recovery for the append-only path)"""
+        logging.info("Repairing data files...")
+        
+        for asset in ASSETS:
+            existing_data = self.load_existing_data(asset)
+            if existing_data is None or len(existing_data) == 0:
+                continue
+            
+            repaired_data = sort_and_dedupe(existing_data)
+            
+            if self.merge_and_save_data(asset, repaired_data, replace_existing=True):
+                logging.info(f"REPAIRED {asset}: {len(existing_data)} -> {len(repaired_data)} candles")
+            else:
+                logging.error(f"FAILED: Could not repair {asset}")
+        
+        self.save_cursors()
+    
     def verify_data_integrity(self):
         """Verify the integrity of saved data files"""
         logging.info("Verifying data integrity...")
         
+        jobs = []
         for asset in ASSETS:
             file_path = self.get_file_path(asset)
-            
             if os.path.exists(file_path):
-                try:
-                    df = pd.read_csv(file_path)
-                    
-                    if len(df) > 0:
-                        # Check for required columns
-                        required_cols = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-                        missing_cols = [col for col in required_cols if col not in df.columns]
-                        
-                        if missing_cols:
-                            logging.warning(f"WARNING {asset}: Missing columns {missing_cols}")
-                        else:
-                            # Check for data gaps
-                            df['timestamp'] = pd.to_datetime(df['timestamp'], format='%Y-%m-%d %H:%M:%S')
-                            df = df.sort_values('timestamp')
-                            
-                            # Calculate date range
-                            date_range = (df['timestamp'].max() - df['timestamp'].min()).days
-                            
-                            # Check for 30-minute intervals
-                            time_diffs = df['timestamp'].diff()
-                            expected_diff = timedelta(minutes=30)
-                            
-                            gaps = time_diffs[time_diffs > expected_diff * 1.5]  # Allow some tolerance
-                            
-                            if len(gaps) > 0:
-                                logging.warning(f"WARNING {asset}: Found {len(gaps)} data gaps")
-                            
-                            logging.info(f"VERIFIED {asset}: {len(df)} candles, {date_range} days, {df['timestamp'].min()} to {df['timestamp'].max()}")
-                    else:
-                        logging.warning(f"WARNING {asset}: Empty data file")
-                        
-                except Exception as e:
-                    logging.error(f"ERROR verifying {asset}: {str(e)}")
+                parts = self.get_parquet_parts(asset) if STORAGE_FORMAT == 'parquet' else None
+                jobs.append((asset, file_path, parts))
             else:
                 logging.warning(f"WARNING {asset}: Data file not found")
+        
+        if not jobs:
+            return
+        
+        # Each file is an independent parse + gap scan, so spread them over the cores;
+        # workers only return their messages and all logging happens here. Forked
+        # workers must not inherit buffered records they could write out again.
+        log_buffer.flush()
+        assets, file_paths, parts = zip(*jobs)
+        workers = min(os.cpu_count() or 1, len(jobs))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # Hand files out in batches so ~90 small jobs don't each pay an IPC round trip
+                chunksize = max(1, len(jobs) // (workers * 4))
+                results = list(executor.map(_verify_one, assets, file_paths, parts, chunksize=chunksize))
+        except Exception as e:
+            logging.warning(f"Parallel verification unavailable ({str(e)}), verifying serially")
+            results = [_verify_one(*job) for job in jobs]
+        
+        for messages in results:
+            for level, message in messages:
+                logging.log(level, message)
 
-def run_update_cycle():
-    """Run a single update cycle"""
+def run_update_cycle(puller=None):
+    """Run a single update cycle (schedulers pass their long-lived puller to reuse)"""
+    owns_puller = puller is None
     try:
-        puller = HyperliquidOHLCPuller()
+        if owns_puller:
+            puller = HyperliquidOHLCPuller()
         puller.update_all_assets()
         
         # Verify data integrity every few cycles
-        if datetime.now().hour % 6 == 0 and datetime.now().minute < 30:
+        now = datetime.now()
+        if now.hour % 6 == 0 and now.minute < 30:
             puller.verify_data_integrity()
             
     except Exception as e:
         logging.error(f"Error in update cycle: {str(e)}")
         logging.error(traceback.format_exc())
+    finally:
+        if owns_puller and puller is not None:
+            puller.close()
 
-def run_initial_setup():
+def run_initial_setup(puller=None):
     """Run initial setup to create data files"""
     logging.info("Running initial setup...")
     
+    owns_puller = puller is None
     try:
-        puller = HyperliquidOHLCPuller()
+        if owns_puller:
+            puller = HyperliquidOHLCPuller()
         puller.update_all_assets()
         puller.verify_data_integrity()
         
@@ -558,6 +1513,9 @@ def run_initial_setup():
     except Exception as e:
         logging.error(f"Error in initial setup: {str(e)}")
         logging.error(traceback.format_exc())
+    finally:
+        if owns_puller and puller is not None:
+            puller.close()
 
 def main():
     """Main function to run the scheduler"""
@@ -569,11 +1527,12 @@ def main():
     # Check if running in GitHub Actions
     if os.getenv('GITHUB_ACTIONS'):
         logging.info("Running in GitHub Actions - single run mode")
+        puller = None
         try:
             puller = HyperliquidOHLCPuller()
             
             # Check if we need initial setup (no existing data files)
-            existing_files = [f for f in os.listdir(DOWNLOADS_FOLDER) if f.endswith('_ohlc_30.csv')]
+            existing_files = find_existing_data_files()
             if len(existing_files) == 0:
                 logging.info("No existing data found - running initial setup...")
                 puller.update_all_assets()
@@ -588,31 +1547,51 @@ def main():
         except Exception as e:
             logging.error(f"Error in GitHub Actions run: {str(e)}")
             logging.error(traceback.format_exc())
-            import sys
             sys.exit(1)
+        finally:
+            if puller is not None:
+                puller.close()
+    
+    # Manual recovery: rewrite data files from their own contents
+    if '--repair' in sys.argv:
+        logging.info("Running data repair...")
+        puller = None
+        try:
+            puller = HyperliquidOHLCPuller()
+            puller.repair_data_files()
+            puller.verify_data_integrity()
+            return
+            
+        except Exception as e:
+            logging.error(f"Error in data repair: {str(e)}")
+            logging.error(traceback.format_exc())
+            sys.exit(1)
+        finally:
+            if puller is not None:
+                puller.close()
     
     # Check if running in automated mode (for local use)
-    import sys
     automated_mode = '--auto' in sys.argv or os.getenv('AUTO_MODE', '').lower() == 'true'
 
     if automated_mode:
         logging.info("Running in automated mode - starting continuous scheduler...")
         logging.info(f"Update interval: Every 30 minutes")
+        puller = None
         try:
-            # Run initial setup if no data exists
+            # One puller (HTTP session, symbol list, cursors) serves every scheduled cycle
             puller = HyperliquidOHLCPuller()
 
             # Check if we need initial setup (no existing data files)
-            existing_files = [f for f in os.listdir(DOWNLOADS_FOLDER) if f.endswith('_ohlc_30.csv')]
+            existing_files = find_existing_data_files()
             if len(existing_files) == 0:
                 logging.info("No existing data found - running initial setup...")
-                run_initial_setup()
+                run_initial_setup(puller)
             else:
                 logging.info(f"Found {len(existing_files)} existing data files - running update cycle...")
-                run_update_cycle()
+                run_update_cycle(puller)
 
             # Schedule regular updates every 30 minutes
-            schedule.every(30).minutes.do(run_update_cycle)
+            schedule.every(30).minutes.do(run_update_cycle, puller)
 
             logging.info("Automated scheduler started - will update every 30 minutes")
             logging.info("Running continuously... (Ctrl+C to stop)")
@@ -626,6 +1605,9 @@ def main():
         except Exception as e:
             logging.error(f"Error in automated mode: {str(e)}")
             logging.error(traceback.format_exc())
+        finally:
+            if puller is not None:
+                puller.close()
     else:
         # Interactive mode
         print("\nChoose an option:")
@@ -636,6 +1618,7 @@ def main():
         print("5. Run automated mode (initial setup + continuous)")
         print("6. Force rebuild all data (365 days)")
 
+        puller = None
         try:
             choice = input("Enter choice (1-6): ").strip()
 
@@ -647,12 +1630,13 @@ def main():
                 run_update_cycle()
             elif choice == "3":
                 logging.info("Starting continuous scheduler...")
+                puller = HyperliquidOHLCPuller()
 
                 # Run initial update
-                run_update_cycle()
+                run_update_cycle(puller)
 
                 # Schedule regular updates every 30 minutes
-                schedule.every(30).minutes.do(run_update_cycle)
+                schedule.every(30).minutes.do(run_update_cycle, puller)
 
                 logging.info("Scheduler started - will update every 30 minutes")
                 logging.info("Press Ctrl+C to stop")
@@ -684,6 +1668,10 @@ def main():
         except Exception as e:
             logging.error(f"Error: {str(e)}")
             logging.error(traceback.format_exc())
+        finally:
+            # Options 3, 4 and 6 hold a puller; release it however the branch ended
+            if puller is not None:
+                puller.close()
 
 if __name__ == "__main__":
     main()